@@ -1,7 +1,7 @@
 import logging
 
 from fastapi import APIRouter, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from module.conf import settings
 from module.models import APIResponse, Config
@@ -13,7 +13,7 @@ logger = logging.getLogger(__name__)
 
 @router.get("/get", response_model=Config, dependencies=[Depends(get_current_user)])
 async def get_config():
-    return settings
+    return ORJSONResponse(settings.dict())
 
 
 @router.patch(
@@ -21,17 +21,16 @@ async def get_config():
 )
 async def update_config(config: Config):
     try:
-        settings.save(config_dict=config.dict())
-        settings.load()
+        settings.update(config)
         # update_rss()
         logger.info("Config updated")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={"msg_en": "Update config successfully.", "msg_zh": "更新配置成功。"},
         )
     except Exception as e:
         logger.warning(e)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=406,
             content={"msg_en": "Update config failed.", "msg_zh": "更新配置失败。"},
         )
@@ -48,6 +48,11 @@ class Settings(Config):
         with open(CONFIG_PATH, "w", encoding="utf-8") as f:
             json.dump(config_dict, f, indent=4, ensure_ascii=False)
 
+    def update(self, config: Config):
+        # Persist an already validated config, no need to parse it back from disk
+        self.save(config_dict=config.dict())
+        self.__dict__.update(config.__dict__)
+
     def init(self):
         load_dotenv(".env")
         self.__load_from_env()
@@ -95,7 +95,7 @@ class BangumiDatabase:
             return None
         else:
             logger.debug(f"[Database] Find bangumi id: {_id}.")
-            return self.session.exec(statement).first()
+            return bangumi
 
     def match_poster(self, bangumi_name: str) -> str:
         # Use like to match
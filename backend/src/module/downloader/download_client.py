@@ -4,6 +4,7 @@ from module.conf import settings
 from module.models import Bangumi, Torrent
 from module.network import RequestContent
 
+from .client.qb_downloader import QbDownloader
 from .path import TorrentPath
 
 logger = logging.getLogger(__name__)
@@ -24,8 +25,6 @@ class DownloadClient(TorrentPath):
         password = settings.downloader.password
         ssl = settings.downloader.ssl
         if type == "qbittorrent":
-            from .client.qb_downloader import QbDownloader
-
             return QbDownloader(host, username, password, ssl)
         else:
             logger.error(f"[Downloader] Unsupported downloader type: {type}")
@@ -10,15 +10,16 @@ logger = logging.getLogger(__name__)
 
 class TorrentManager(Database):
     @staticmethod
-    def __match_torrents_list(data: Bangumi | BangumiUpdate) -> list:
-        with DownloadClient() as client:
-            torrents = client.get_torrent_info(status_filter=None)
+    def __match_torrents_list(
+        data: Bangumi | BangumiUpdate, client: DownloadClient
+    ) -> list:
+        torrents = client.get_torrent_info(status_filter=None)
         return [
             torrent.hash for torrent in torrents if torrent.save_path == data.save_path
         ]
 
     def delete_torrents(self, data: Bangumi, client: DownloadClient):
-        hash_list = self.__match_torrents_list(data)
+        hash_list = self.__match_torrents_list(data, client)
         if hash_list:
             client.delete_torrent(hash_list)
             logger.info(f"Delete rule and torrents for {data.official_title}")
@@ -108,8 +109,8 @@ class TorrentManager(Database):
         old_data: Bangumi = self.bangumi.search_id(bangumi_id)
         if old_data:
             # Move torrent
-            match_list = self.__match_torrents_list(old_data)
             with DownloadClient() as client:
+                match_list = self.__match_torrents_list(old_data, client)
                 path = client._gen_save_path(data)
                 if match_list:
                     client.move_torrent(match_list, path)
@@ -14,17 +14,16 @@ from .plugin import (
 logger = logging.getLogger(__name__)
 
 
+NOTIFIERS = {
+    "telegram": TelegramNotification,
+    "server-chan": ServerChanNotification,
+    "bark": BarkNotification,
+    "wecom": WecomNotification,
+}
+
+
 def getClient(type: str):
-    if type.lower() == "telegram":
-        return TelegramNotification
-    elif type.lower() == "server-chan":
-        return ServerChanNotification
-    elif type.lower() == "bark":
-        return BarkNotification
-    elif type.lower() == "wecom":
-        return WecomNotification
-    else:
-        return None
+    return NOTIFIERS.get(type.lower())
 
 
 class PostNotification:
@@ -1,6 +1,7 @@
-import json
 from typing import TypeAlias
 
+import orjson
+
 from module.models import Bangumi, RSSItem, Torrent
 from module.network import RequestContent
 from module.rss import RSSAnalyser
@@ -41,7 +42,7 @@ class SearchTorrent(RequestContent, RSSAnalyser):
                 if special_link not in exist_list:
                     bangumi.rss_link = special_link
                     exist_list.append(special_link)
-                    yield json.dumps(bangumi.dict(), separators=(",", ":"))
+                    yield orjson.dumps(bangumi.dict()).decode("utf-8")
 
     @staticmethod
     def special_url(data: Bangumi, site: str) -> RSSItem: